@@ -1,102 +1,342 @@
 import json
 import asyncio
+import logging
+import functools
 import httpx
 import os
 import time
+from dataclasses import dataclass
+
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
+logger = logging.getLogger("axp")
+
+def _is_transient(exc):
+    # Worth retrying: connection/read failures and 429/5xx responses.
+    # Other HTTP errors (auth failures, bad requests) fail immediately.
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return (isinstance(exc, httpx.HTTPStatusError)
+            and (exc.response.status_code == 429 or exc.response.status_code >= 500))
+
+_retry_transient = retry(
+    stop=stop_after_attempt(4),
+    wait=wait_exponential_jitter(initial=0.2, max=5),
+    retry=retry_if_exception(_is_transient),
+    reraise=True)
+
+try:
+    import orjson
+    def _json_loads(data):
+        return orjson.loads(data)
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    # orjson is optional; fall back to the stdlib parser.
+    def _json_loads(data):
+        return json.loads(data)
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+try:
+    import ijson
+except ImportError:
+    # ijson is optional; queue pages fall back to buffered parsing.
+    ijson = None
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy is optional; bulk status falls back to plain Python lists.
+    np = None
+
+def bulk_expiration_status(clients):
+    # Vectorized remaining-lifetime computation across many AxpClient
+    # instances, for supervisors polling lots of tenants at once. Returns
+    # (access_remaining, refresh_remaining) arrays clipped at zero.
+    now = time.time()
+    if np is None:
+        access = [max(0.0, c.token_expires_at - now) for c in clients]
+        refresh = [max(0.0, c.refresh_token_expires_at - now) for c in clients]
+        return access, refresh
+    access = np.fromiter(
+        (c.token_expires_at for c in clients), dtype=np.float64, count=len(clients))
+    refresh = np.fromiter(
+        (c.refresh_token_expires_at for c in clients), dtype=np.float64, count=len(clients))
+    return np.maximum(0.0, access - now), np.maximum(0.0, refresh - now)
+
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    # Without the h2 package httpx would refuse http2=True outright.
+    _HTTP2 = False
+
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    # Only advertise brotli when a decoder is actually installed.
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+class _AsyncStreamReader:
+    # Adapts an async byte iterator (httpx's aiter_bytes) to the async
+    # file-like interface ijson expects.
+    def __init__(self, aiter):
+        self._it = aiter.__aiter__()
+
+    async def read(self, size=-1):
+        if size == 0:
+            # ijson probes with read(0) to detect bytes vs str sources.
+            return b''
+        try:
+            return await self._it.__anext__()
+        except StopAsyncIteration:
+            return b''
+
+@dataclass(frozen=True)
+class Config:
+    client_id: str
+    client_secret: str
+    account_id: str
+    auth_token_url: str
+
+@functools.lru_cache(maxsize=None)
+def _load_config(config_file):
+    # Parse the config exactly once per path; every AxpClient constructed
+    # afterwards gets the same immutable Config without re-reading the file.
+    if not os.path.exists(config_file):
+        raise FileNotFoundError(f"Config file not found: {config_file}")
+    with open(config_file, 'r') as f:
+        config = json.load(f)
+    client_id = config.get("AVAYA_AXP_CLIENT_ID")
+    client_secret = config.get("AVAYA_AXP_CLIENT_SECRET")
+    account_id = config.get("AVAYA_ACCOUNT_ID")
+    if not all([client_id, client_secret, account_id]):
+        raise ValueError("Missing client ID, client secret, account ID, or auth token URL in config file.")
+    auth_token_url = f"https://na.api.avayacloud.com/api/auth/v1/{account_id}/protocol/openid-connect/token"
+    return Config(client_id, client_secret, account_id, auth_token_url)
+
+_TOKEN_CACHE_FILE = os.path.expanduser("~/.cache/axp/tokens.json")
 
 class AxpClient:
-    def __init__(self, config_file="config.json"):
+    def __init__(self, config_file="config.json", http_timeout=None, http_limits=None):
         self.config_file = config_file
-        self.client_id = None
-        self.client_secret = None
-        self.account_id = None
-        self.auth_token_url = None
+        self._cfg = _load_config(config_file)
+        # Explicit timeouts bound tail latency when an endpoint hangs, and
+        # the connection limits cap fd usage under bursty pagination while
+        # keepalive_expiry keeps warm connections alive between commands.
+        # Both are overridable per instance for callers who want to tune.
+        self._http_timeout = http_timeout if http_timeout is not None else httpx.Timeout(
+            connect=5.0, read=15.0, write=5.0, pool=5.0)
+        self._http_limits = http_limits if http_limits is not None else httpx.Limits(
+            max_connections=64, max_keepalive_connections=16, keepalive_expiry=30.0)
         self.bearer_token = None
         self.refresh_token = None
         self.token_expires_at = 0
         self.refresh_token_expires_at = 0
+        # Monotonic deadlines drive the freshness checks (immune to NTP
+        # clock jumps); the wall-clock *_expires_at fields are kept only
+        # for status display.
+        self._access_deadline = 0.0
+        self._refresh_deadline = 0.0
         self.token_refresh_task = None
-        self.queues = []
-        self._load_config()
-
-    def _load_config(self):
-        if not os.path.exists(self.config_file):
-            raise FileNotFoundError(f"Config file not found: {self.config_file}")
-        with open(self.config_file, 'r') as f:
-            config = json.load(f)
-            self.client_id = config.get("AVAYA_AXP_CLIENT_ID")
-            self.client_secret = config.get("AVAYA_AXP_CLIENT_SECRET")
-            self.account_id = config.get("AVAYA_ACCOUNT_ID")
-            self.auth_token_url = f"https://na.api.avayacloud.com/api/auth/v1/{self.account_id}/protocol/openid-connect/token"
-
-        if not all([self.client_id, self.client_secret, self.account_id, self.auth_token_url]):
-            raise ValueError("Missing client ID, client secret, account ID, or auth token URL in config file.")
-
-    async def _authenticate(self):
-        print("Attempting to authenticate and obtain new tokens...")
-        token_url = self.auth_token_url
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        data = {
+        # Queues are stored column-wise (parallel lists) rather than as a
+        # list of per-row dicts; row i is (queue_ids[i], queue_names[i]).
+        self.queue_ids = []
+        self.queue_names = []
+        # Per-page ETags and parsed results for conditional GETs; a 304
+        # lets a re-walk reuse the cached page without transferring or
+        # re-parsing the body.
+        self._queues_etags = {}
+        self._queues_page_cache = {}
+        self._http = None
+        self._token_ready = asyncio.Event()
+        self._token_lock = asyncio.Lock()
+        # Static request pieces built once instead of per call; the bearer
+        # headers are rebuilt only when the token itself changes.
+        self._form_headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        self._auth_data_base = {
             "grant_type": "client_credentials",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret
+            "client_id": self._cfg.client_id,
+            "client_secret": self._cfg.client_secret
         }
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(token_url, headers=headers, data=data)
-                response.raise_for_status()
-                token_data = response.json()
-                self.bearer_token = token_data["access_token"]
-                self.refresh_token = token_data["refresh_token"]
-                self.token_expires_at = time.time() + token_data["expires_in"]
-                self.refresh_token_expires_at = time.time() + token_data["refresh_expires_in"]
-                print("Authentication successful. New tokens obtained.")
-                return True
-            except httpx.HTTPStatusError as e:
-                print(f"HTTP error during authentication: {e}")
-                print(f"Response: {e.response.text}")
-            except Exception as e:
-                print(f"An error occurred during authentication: {e}")
-        return False
+        self._bearer_headers = {}
+        self._load_token_cache()
 
-    async def _refresh_access_token(self):
-        print("Attempting to refresh access token...")
-        token_url = self.auth_token_url
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
+    def _set_tokens(self, token_data):
+        self.bearer_token = token_data["access_token"]
+        self.refresh_token = token_data.get("refresh_token", self.refresh_token) # Use new refresh token if provided
+        self.token_expires_at = time.time() + token_data["expires_in"]
+        self._access_deadline = time.monotonic() + token_data["expires_in"] - 50
+        if "refresh_expires_in" in token_data:
+            self.refresh_token_expires_at = time.time() + token_data["refresh_expires_in"]
+            self._refresh_deadline = time.monotonic() + token_data["refresh_expires_in"]
+        self._bearer_headers = {
+            "Authorization": f"Bearer {self.bearer_token}",
+            "Content-Type": "application/json"
         }
+        self._token_ready.set()
+        self._save_token_cache()
+
+    def _load_token_cache(self):
+        # Reload tokens from a previous run so a restart can skip the
+        # startup auth round-trip while the stored tokens are still valid.
+        try:
+            with open(_TOKEN_CACHE_FILE, 'rb') as f:
+                cached = _json_loads(f.read())
+        except (OSError, ValueError):
+            return
+        if time.time() >= cached.get("refresh_token_expires_at", 0):
+            return
+        self.bearer_token = cached.get("bearer_token")
+        self.refresh_token = cached.get("refresh_token")
+        self.token_expires_at = cached.get("token_expires_at", 0)
+        self.refresh_token_expires_at = cached.get("refresh_token_expires_at", 0)
+        # Rebase the persisted wall-clock stamps onto this process's
+        # monotonic clock.
+        now = time.time()
+        mono = time.monotonic()
+        self._access_deadline = mono + (self.token_expires_at - now) - 50
+        self._refresh_deadline = mono + (self.refresh_token_expires_at - now)
+        if self.bearer_token:
+            self._bearer_headers = {
+                "Authorization": f"Bearer {self.bearer_token}",
+                "Content-Type": "application/json"
+            }
+            if self._token_is_fresh():
+                self._token_ready.set()
+                logger.info("Reusing cached tokens from previous session.")
+
+    def _save_token_cache(self):
+        # Atomic write (os.replace) with owner-only permissions, so a crash
+        # never leaves a truncated cache and tokens aren't world-readable.
+        try:
+            os.makedirs(os.path.dirname(_TOKEN_CACHE_FILE), exist_ok=True)
+            tmp_path = f"{_TOKEN_CACHE_FILE}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps({
+                    "bearer_token": self.bearer_token,
+                    "refresh_token": self.refresh_token,
+                    "token_expires_at": self.token_expires_at,
+                    "refresh_token_expires_at": self.refresh_token_expires_at
+                }))
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, _TOKEN_CACHE_FILE)
+        except OSError as e:
+            logger.warning("Could not persist token cache: %s", e)
+
+    async def _client(self):
+        # Lazily create a single shared AsyncClient so every request reuses
+        # pooled keep-alive connections instead of paying a fresh TCP + TLS
+        # handshake per call.
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=_HTTP2,
+                headers={
+                    "Accept-Encoding": _ACCEPT_ENCODING,
+                    "User-Agent": "axp-audit/1.0"
+                },
+                limits=self._http_limits,
+                timeout=self._http_timeout
+            )
+        return self._http
+
+    async def close(self):
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+
+    async def __aenter__(self):
+        await self._client()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @_retry_transient
+    async def _send(self, method, url, **kwargs):
+        # One attempt on the shared client; raises on 429/5xx so the retry
+        # decorator backs off and re-sends, but hands other statuses back
+        # to the caller untouched.
+        client = await self._client()
+        response = await client.request(method, url, **kwargs)
+        if response.status_code == 429 or response.status_code >= 500:
+            response.raise_for_status()
+        return response
+
+    async def _request(self, method, url, *, headers=None, data=None, retry_auth=True, timeout=httpx.USE_CLIENT_DEFAULT):
+        # Single place for the shared-client send, error logging and JSON
+        # decode that every endpoint used to duplicate. Returns the decoded
+        # body, or None on failure. A 401 triggers one refresh-and-retry,
+        # except on the auth endpoint itself (retry_auth=False). timeout=
+        # overrides the client default for an individual call.
+        try:
+            response = await self._send(method, url, headers=headers, data=data, timeout=timeout)
+            if response.status_code == 401 and retry_auth:
+                # Token may have been invalidated server-side before its
+                # advertised expiry; refresh once and retry.
+                if await self._refresh_access_token():
+                    response = await self._send(method, url, headers=self._bearer_headers, data=data, timeout=timeout)
+            response.raise_for_status()
+            return _json_loads(response.content)
+        except httpx.HTTPStatusError as e:
+            logger.error("HTTP error on %s %s: %s", method, url, e)
+            logger.error("Response: %s", e.response.text)
+        except Exception as e:
+            logger.error("An error occurred on %s %s: %s", method, url, e)
+        return None
+
+    async def _authenticate(self):
+        logger.info("Attempting to authenticate and obtain new tokens...")
+        token_data = await self._request(
+            "POST", self._cfg.auth_token_url,
+            headers=self._form_headers, data=self._auth_data_base, retry_auth=False)
+        if token_data is None:
+            return False
+        self._set_tokens(token_data)
+        logger.info("Authentication successful. New tokens obtained.")
+        return True
+
+    async def _refresh_access_token(self):
+        logger.info("Attempting to refresh access token...")
         data = {
+            **self._auth_data_base,
             "grant_type": "refresh_token",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
             "refresh_token": self.refresh_token
         }
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(token_url, headers=headers, data=data)
-                response.raise_for_status()
-                token_data = response.json()
-                self.bearer_token = token_data["access_token"]
-                self.refresh_token = token_data.get("refresh_token", self.refresh_token) # Use new refresh token if provided
-                self.token_expires_at = time.time() + token_data["expires_in"]
-                if "refresh_expires_in" in token_data:
-                    self.refresh_token_expires_at = time.time() + token_data["refresh_expires_in"]
-                print("Access token refreshed successfully.")
-                return True
-            except httpx.HTTPStatusError as e:
-                print(f"HTTP error refreshing token: {e}")
-                print(f"Response: {e.response.text}")
-            except Exception as e:
-                print(f"An error occurred refreshing token: {e}")
-        return False
-
-    async def get_bearer_token(self):
-        # Check if the access token is expired or close to expiring
-        if not self.bearer_token or time.time() >= self.token_expires_at - 50:
+        token_data = await self._request(
+            "POST", self._cfg.auth_token_url,
+            headers=self._form_headers, data=data, retry_auth=False)
+        if token_data is None:
+            return False
+        self._set_tokens(token_data)
+        logger.info("Access token refreshed successfully.")
+        return True
+
+    def get_bearer_token(self):
+        # Fast path: the background refresh task keeps the token fresh, so
+        # reading it is a plain attribute access with no await.
+        return self.bearer_token
+
+    def _token_is_fresh(self):
+        # Single monotonic read and one compare on the hot path; the 50 s
+        # safety margin is already baked into the deadline.
+        return bool(self.bearer_token) and time.monotonic() < self._access_deadline
+
+    async def ensure_bearer_token(self):
+        # Fallback for clock skew or a stalled refresh task: refresh inline
+        # if the token is expired or close to expiring.
+        if self._token_is_fresh():
+            return self.bearer_token
+        # Double-checked locking: only one coroutine performs the refresh;
+        # concurrent callers wait on the lock and then see the fresh token,
+        # so a burst of requests costs a single auth round-trip.
+        async with self._token_lock:
+            if self._token_is_fresh():
+                return self.bearer_token
             # Check if the refresh token is still valid
-            if self.refresh_token and time.time() < self.refresh_token_expires_at:
+            if self.refresh_token and time.monotonic() < self._refresh_deadline:
                 if not await self._refresh_access_token():
                     # If refresh fails, try a full re-authentication
                     await self._authenticate()
@@ -107,94 +347,134 @@ class AxpClient:
 
     async def _refresh_token_periodically(self):
         while True:
-            # Refresh every 500 seconds
-            await asyncio.sleep(60)
-            await self.get_bearer_token()
+            if not self.bearer_token or time.monotonic() >= self._access_deadline - 70:
+                await self.ensure_bearer_token()
+            # Sleep until ~2 minutes before the token expires (the deadline
+            # already carries a 50 s margin) so the refresh finishes off the
+            # request path, but never poll faster than 30 s.
+            delay = max(30, self._access_deadline - time.monotonic() - 70)
+            await asyncio.sleep(delay)
 
     async def start_token_refresh(self):
         if self.token_refresh_task is None:
             self.token_refresh_task = asyncio.create_task(self._refresh_token_periodically())
-            print("Token refresh task started.")
+            logger.info("Token refresh task started.")
 
     async def stop_token_refresh(self):
         if self.token_refresh_task:
             self.token_refresh_task.cancel()
             self.token_refresh_task = None
-            print("Token refresh task stopped.")
+            logger.info("Token refresh task stopped.")
+        await self.close()
 
     def get_token_expiration_status(self):
-        now = time.time()
-        access_token_remaining = self.token_expires_at - now if self.token_expires_at > 0 else 0
-        refresh_token_remaining = self.refresh_token_expires_at - now if self.refresh_token_expires_at > 0 else 0
+        access, refresh = bulk_expiration_status([self])
         return {
-            "access_token_remaining": access_token_remaining,
-            "refresh_token_remaining": refresh_token_remaining
+            "access_token_remaining": float(access[0]),
+            "refresh_token_remaining": float(refresh[0])
         }
 
     # Example of a protected API call
     async def get_user_updates(self):
-        await self.get_bearer_token() # Ensure token is fresh
+        await self.ensure_bearer_token() # Ensure token is fresh
         if not self.bearer_token:
-            print("Cannot get user updates: no bearer token available.")
+            logger.warning("Cannot get user updates: no bearer token available.")
             return None
 
-        updates_url = f"https://na.api.avayacloud.com/api/v1/{self.account_id}/user/updates" # Example endpoint
-        headers = {
-            "Authorization": f"Bearer {self.bearer_token}",
-            "Content-Type": "application/json"
-        }
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(updates_url, headers=headers)
+        updates_url = f"https://na.api.avayacloud.com/api/v1/{self._cfg.account_id}/user/updates" # Example endpoint
+        return await self._request("GET", updates_url, headers=self._bearer_headers)
+
+    @_retry_transient
+    async def _fetch_queue_page(self, url, headers):
+        # Fetch a single page and return (ids, names, next_url) with the
+        # queues projected straight into the columnar layout. The next link
+        # is a relative path, so we need to construct the full URL.
+        client = await self._client()
+        # Conditional GET: if we hold an ETag for this page, let the server
+        # answer 304 and reuse the parsed result from the previous walk.
+        etag = self._queues_etags.get(url)
+        if etag and url in self._queues_page_cache:
+            headers = {**headers, "If-None-Match": etag}
+        ids = []
+        names = []
+        if ijson is None:
+            response = await client.get(url, headers=headers)
+            if response.status_code == 304:
+                return self._queues_page_cache[url]
+            response.raise_for_status()
+            data = _json_loads(response.content)
+            for queue in data.get('queues', []):
+                ids.append(queue.get('queueId'))
+                names.append(queue.get('name'))
+            next_path = data.get('links', {}).get('next')
+            response_etag = response.headers.get('etag')
+        else:
+            # Stream the body and keep only the two fields we retain, so a
+            # page never materializes its full object tree in memory.
+            next_path = None
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304:
+                    return self._queues_page_cache[url]
+                if response.status_code >= 400:
+                    await response.aread()  # make e.response.text available
                 response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                print(f"HTTP error getting user updates: {e}")
-                print(f"Response: {e.response.text}")
-            except Exception as e:
-                print(f"An error occurred getting user updates: {e}")
-        return None
+                reader = _AsyncStreamReader(response.aiter_bytes())
+                async for prefix, event, value in ijson.parse(reader):
+                    if prefix == 'queues.item' and event == 'start_map':
+                        ids.append(None)
+                        names.append(None)
+                    elif prefix == 'queues.item.queueId':
+                        ids[-1] = value
+                    elif prefix == 'queues.item.name':
+                        names[-1] = value
+                    elif prefix == 'links.next':
+                        next_path = value
+            response_etag = response.headers.get('etag')
+        next_url = f"https://na.cc.avayacloud.com{next_path}" if next_path else None
+        if response_etag:
+            self._queues_etags[url] = response_etag
+            self._queues_page_cache[url] = (ids, names, next_url)
+        return ids, names, next_url
 
     async def get_queues(self):
-        await self.get_bearer_token()  # Ensure token is fresh
+        await self.ensure_bearer_token()  # Ensure token is fresh
         if not self.bearer_token:
-            print("Cannot get queues: no bearer token available.")
+            logger.warning("Cannot get queues: no bearer token available.")
             return None
 
-        self.queues = []
-        queues_url = f"https://na.cc.avayacloud.com/api/admin/match/v1beta/accounts/{self.account_id}/queues"
-        headers = {
-            "Authorization": f"Bearer {self.bearer_token}",
-            "Content-Type": "application/json"
-        }
-        async with httpx.AsyncClient() as client:
-            while queues_url:
-                try:
-                    response = await client.get(queues_url, headers=headers)
-                    response.raise_for_status()
-                    data = response.json()
-                    for queue in data.get('queues', []):
-                        self.queues.append({
-                            'queueId': queue.get('queueId'),
-                            'name': queue.get('name')
-                        })
-                    
-                    # Handle pagination
-                    if 'links' in data and 'next' in data['links']:
-                        next_path = data['links']['next']
-                        # The next link is a relative path, so we need to construct the full URL
-                        base_url = "https://na.cc.avayacloud.com"
-                        queues_url = f"{base_url}{next_path}"
-                    else:
-                        queues_url = None
-
-                except httpx.HTTPStatusError as e:
-                    print(f"HTTP error getting queues: {e}")
-                    print(f"Response: {e.response.text}")
-                    return None
-                except Exception as e:
-                    print(f"An error occurred getting queues: {e}")
-                    return None
-        print(f"Successfully retrieved {len(self.queues)} queues.")
-        return self.queues
+        # Two-phase update: accumulate into fresh lists and only swap them
+        # in on success, so a failure mid-walk never clobbers the previously
+        # stored queues and callers never observe a half-built listing.
+        new_ids = []
+        new_names = []
+        queues_url = f"https://na.cc.avayacloud.com/api/admin/match/v1beta/accounts/{self._cfg.account_id}/queues"
+        headers = self._bearer_headers
+        # The API only exposes a 'next' link, so pages can't all be fetched
+        # up front. Instead, start the next page's request as soon as the
+        # current page's next link is known, so the HTTP round-trip of page
+        # k+1 overlaps with processing page k.
+        next_task = asyncio.create_task(self._fetch_queue_page(queues_url, headers))
+        try:
+            while next_task:
+                page_ids, page_names, next_url = await next_task
+                next_task = (
+                    asyncio.create_task(self._fetch_queue_page(next_url, headers))
+                    if next_url else None
+                )
+                new_ids.extend(page_ids)
+                new_names.extend(page_names)
+        except httpx.HTTPStatusError as e:
+            logger.error("HTTP error getting queues: %s", e)
+            logger.error("Response: %s", e.response.text)
+            return None
+        except Exception as e:
+            logger.error("An error occurred getting queues: %s", e)
+            return None
+        finally:
+            if next_task:
+                next_task.cancel()
+        self.queue_ids = new_ids
+        self.queue_names = new_names
+        logger.info("Successfully retrieved %d queues.", len(self.queue_ids))
+        return self.queue_ids, self.queue_names
 
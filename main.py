@@ -1,8 +1,25 @@
 import asyncio
 import json
+import logging
+import os
+import sys
 from axp_client import AxpClient
 
+try:
+    import orjson
+    def _print_json(obj):
+        # Write the serialized bytes straight to the stdout buffer, skipping
+        # the intermediate str and its str->bytes re-encode.
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.flush()
+except ImportError:
+    # orjson is optional; fall back to the stdlib serializer.
+    def _print_json(obj):
+        print(json.dumps(obj, indent=2))
+
 async def main():
+    logging.basicConfig(level=os.getenv("AXP_LOG", "INFO"))
     client = AxpClient()
     await client.start_token_refresh()
 
@@ -17,10 +34,12 @@ async def main():
         print("5. Show token status")
         print("6. Exit")
 
-        choice = input("Enter your choice (1-6): ")
+        # Run input() in a thread so the event loop keeps servicing the
+        # background token-refresh task while we wait at the prompt.
+        choice = await asyncio.to_thread(input, "Enter your choice (1-6): ")
 
         if choice == "1":
-            token = await client.get_bearer_token()
+            token = await client.ensure_bearer_token()
             if token:
                 print(f"Bearer Token: {token[:10]}...")
             else:
@@ -30,7 +49,7 @@ async def main():
             user_updates = await client.get_user_updates()
             if user_updates:
                 print("User Updates:")
-                print(json.dumps(user_updates, indent=2))
+                _print_json(user_updates)
             else:
                 print("Failed to get user updates.")
         elif choice == "3":
@@ -38,8 +57,12 @@ async def main():
             await client.get_queues()
         elif choice == "4":
             print("Stored Queues:")
-            if client.queues:
-                print(json.dumps(client.queues, indent=2))
+            if client.queue_ids:
+                # Stream one row at a time instead of building one big
+                # string for the whole listing.
+                for queue_id, name in zip(client.queue_ids, client.queue_names):
+                    sys.stdout.write(f"  {queue_id}\t{name}\n")
+                sys.stdout.flush()
             else:
                 print("No queues stored. Please fetch them first.")
         elif choice == "5":